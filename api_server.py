@@ -10,49 +10,85 @@ Exposes:
     * Events DSL (event_dsl.tx)
 """
 
+import json
+import logging
 import os
-import sys
-from typing import List, Optional, Any
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Dict, List, Optional, Any, Tuple
 
-from fastapi import FastAPI, HTTPException
+import anyio
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Response
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, field_validator
 from textx import TextXError
 
-# ------------------------------------------------------------------
-# Path configuration
-# ------------------------------------------------------------------
-
-BASE_DIR = os.path.dirname(__file__)              # Outer eventDSL folder
-CODE_DIR = os.path.join(BASE_DIR, "eventdsl")     # Inner eventdsl\ folder
-
-if CODE_DIR not in sys.path:
-    sys.path.append(CODE_DIR)
+# Optional: fast JSON serialization in C
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # ------------------------------------------------------------------
 # Internal imports from eventdsl package
 # ------------------------------------------------------------------
 
-from db import (
+from eventdsl.db import (
     init_db,
+    form_rules_fingerprint,
     get_form_rules_for_requester,
-    list_events,
+    connect,
+    iter_event_batches,
     save_event,
 )
-from validators.scheduling import (
+from eventdsl.validators.scheduling import (
     validate_event_scheduling,
     SchedulingValidationError,
 )
 
 # TextX metamodels for both DSLs
-from parsers.rules import event_rules_mm   # Grammar: event_rules_dsl.tx
-from parsers.events import event_mm          # Grammar: event_dsl.tx
+from eventdsl.parsers.rules import get_event_rules_mm   # Grammar: event_rules_dsl.tx
+from eventdsl.parsers.events import get_event_mm        # Grammar: event_dsl.tx
+
+# ------------------------------------------------------------------
+# Lifecycle
+# ------------------------------------------------------------------
+
+
+def _warm_up():
+    """
+    Pay the cold-start costs before the first request arrives:
+    - Create the DB schema and open this thread's connection.
+    - Build both textX metamodels (they are built lazily on first use).
+    - Fill the form-config cache, which also warms SQLite's page cache.
+    """
+    init_db()
+    get_event_rules_mm()
+    get_event_mm()
+    for requester_type in REQUESTER_TYPES:
+        _cached_form_config(requester_type)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Initialize the DB connection / schema and warm caches on startup.
+    """
+    await run_in_threadpool(_warm_up)
+    yield
+
 
 # ------------------------------------------------------------------
 # FastAPI app and CORS
 # ------------------------------------------------------------------
 
-app = FastAPI(title="Event Scheduler DSL API")
+app = FastAPI(
+    title="Event Scheduler DSL API",
+    lifespan=lifespan,
+)
 
 # Allowed frontend origins during development
 origins = [
@@ -67,6 +103,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+logger = logging.getLogger("eventdsl.api")
+
+# Requester types accepted by the form and events endpoints
+REQUESTER_TYPES = frozenset({"Academics", "Students"})
+
 # ------------------------------------------------------------------
 # Pydantic models
 # ------------------------------------------------------------------
@@ -88,7 +129,7 @@ class EventCreate(BaseModel):
     """
     Payload for creating a new event via the API.
     """
-    requester_type: str = Field(..., pattern="^(Academics|Students)$")
+    requester_type: str
     name: str
     date: str        # ISO format: yyyy-mm-dd
     start_time: str  # 24h format: HH:MM
@@ -96,6 +137,14 @@ class EventCreate(BaseModel):
     location: str    # One of the allowed location options
     requester_unit: Optional[str] = None
 
+    @field_validator("requester_type")
+    @classmethod
+    def _check_requester_type(cls, value: str) -> str:
+        # Plain set membership instead of a regex match
+        if value not in REQUESTER_TYPES:
+            raise ValueError("requester_type must be 'Academics' or 'Students'")
+        return value
+
 
 class EventOut(BaseModel):
     """
@@ -123,12 +172,11 @@ class AstRequest(BaseModel):
 # ------------------------------------------------------------------
 
 
-def model_to_dict(
-    obj: Any,
-    max_depth: int = 20,
-    current_depth: int = 0,
-    visited: Optional[set] = None,
-):
+# Structural back-references that would otherwise cause cycles
+_SKIP_ATTRS = frozenset({"parent", "parent_obj", "parent_ref"})
+
+
+def model_to_dict(obj: Any, max_depth: int = 20):
     """
     Convert a textX model instance into a JSON-serializable tree.
 
@@ -145,79 +193,186 @@ def model_to_dict(
     - Structural back-references such as 'parent' are skipped.
     - A 'visited' set of object ids is used to break cycles.
     - 'max_depth' acts as an additional safety limit.
+
+    The tree is walked with an explicit work stack instead of recursion.
+    Children are pushed in reverse so nodes are still visited in
+    depth-first pre-order, which keeps the cycle detection identical
+    to a recursive walk.
     """
-    if visited is None:
-        visited = set()
+    visited = set()
+    root = [None]
 
-    if obj is None:
-        return None
+    # Each work item: (value, container, key in container, depth)
+    work = [(obj, root, 0, 0)]
+
+    while work:
+        value, container, key, depth = work.pop()
+
+        if value is None:
+            continue
+
+        # Depth guard to prevent very deep or malformed structures
+        if depth > max_depth:
+            container[key] = {"__type__": "MaxDepthReached"}
+            continue
 
-    # Depth guard to prevent very deep or malformed structures
-    if current_depth > max_depth:
-        return {"__type__": "MaxDepthReached"}
-
-    # Primitive types are left as-is
-    if isinstance(obj, (str, int, float, bool)):
-        return obj
-
-    # Sequences (lists, tuples) are converted element by element
-    if isinstance(obj, (list, tuple)):
-        return [
-            model_to_dict(
-                item,
-                max_depth=max_depth,
-                current_depth=current_depth + 1,
-                visited=visited,
-            )
-            for item in obj
-        ]
-
-    # Objects with attributes
-    if hasattr(obj, "__dict__"):
-        obj_id = id(obj)
+        # Primitive types are left as-is
+        if isinstance(value, (str, int, float, bool)):
+            container[key] = value
+            continue
+
+        # Sequences (lists, tuples) are converted element by element
+        if isinstance(value, (list, tuple)):
+            items = [None] * len(value)
+            container[key] = items
+            for index in range(len(value) - 1, -1, -1):
+                work.append((value[index], items, index, depth + 1))
+            continue
+
+        # Objects with attributes
+        try:
+            attrs = vars(value)
+        except TypeError:
+            # Fallback for unsupported types
+            container[key] = str(value)
+            continue
+
+        obj_id = id(value)
 
         # Cycle detection: if we have already seen this object, stop here
         if obj_id in visited:
-            return {
-                "__type__": obj.__class__.__name__,
+            container[key] = {
+                "__type__": value.__class__.__name__,
                 "__note__": "circular_reference",
             }
+            continue
 
         visited.add(obj_id)
 
-        data = {"__type__": obj.__class__.__name__}
+        data = {"__type__": value.__class__.__name__}
+        container[key] = data
 
-        for attr_name, value in obj.__dict__.items():
+        children = []
+        for attr_name, attr_value in attrs.items():
             # Skip internal and structural attributes that cause cycles
-            if attr_name.startswith("_"):
-                continue
-            if attr_name in ("parent", "parent_obj", "parent_ref"):
+            if attr_name[:1] == "_" or attr_name in _SKIP_ATTRS:
                 continue
+            # Reserve the key now so attribute order is preserved
+            data[attr_name] = None
+            children.append((attr_value, data, attr_name, depth + 1))
 
-            data[attr_name] = model_to_dict(
-                value,
-                max_depth=max_depth,
-                current_depth=current_depth + 1,
-                visited=visited,
-            )
+        work.extend(reversed(children))
 
-        return data
+    return root[0]
 
-    # Fallback for unsupported types
-    return str(obj)
+
+def _dumps(data: Any) -> bytes:
+    """
+    Serialize a JSON-compatible structure to bytes, using orjson if available.
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
 
 
 # ------------------------------------------------------------------
-# Lifecycle
+# AST caching
 # ------------------------------------------------------------------
 
+# Parsing holds the GIL, so running many parses at once in one worker
+# only makes every request slower. Cap concurrent parses per worker and
+# scale with uvicorn workers instead (see main_api.py).
+AST_PARSE_CONCURRENCY = int(os.environ.get("EVENTDSL_PARSE_CONCURRENCY", "2"))
+_parse_limiter = anyio.CapacityLimiter(AST_PARSE_CONCURRENCY)
+
+# The frontend editors re-submit the same source over and over, so the
+# serialized response body is memoized per source text (bounded LRU).
+AST_CACHE_SIZE = 256
+
+# Both DSLs are a flat sequence of independent top-level blocks
+# ('add event ...' / 'event_form ...'). Each block is parsed and cached
+# on its own, so an edit only re-parses the block(s) it touched.
+AST_BLOCK_CACHE_SIZE = 1024
+
+# Strings are matched first so keywords inside them never split a block
+_EVENTS_BLOCK_RE = re.compile(r'"[^"]*"|\b(add)\b')
+_RULES_BLOCK_RE = re.compile(r'"[^"]*"|\b(event_form)\b')
+
 
-@app.on_event("startup")
-def on_startup():
+def _split_blocks(code: str, block_re) -> List[str]:
     """
-    Initialize the DB connection / schema when the API starts.
+    Split DSL source at every top-level block keyword.
+
+    Any text before the first keyword (e.g. initialize_runtime) stays
+    attached to the first block so that every chunk is a valid model
+    on its own. Concatenating the chunks gives back the original text.
     """
-    init_db()
+    starts = [m.start(1) for m in block_re.finditer(code) if m.group(1)]
+    bounds = [0] + starts[1:] + [len(code)]
+    return [code[a:b] for a, b in zip(bounds, bounds[1:])]
+
+
+@lru_cache(maxsize=AST_BLOCK_CACHE_SIZE)
+def _rules_block_ast(chunk: str) -> dict:
+    return model_to_dict(get_event_rules_mm().model_from_str(chunk))
+
+
+@lru_cache(maxsize=AST_BLOCK_CACHE_SIZE)
+def _events_block_ast(chunk: str) -> dict:
+    return model_to_dict(get_event_mm().model_from_str(chunk))
+
+
+def _incremental_ast(code: str, mm, block_re, block_ast, list_attr: str) -> dict:
+    """
+    Build the AST of a whole document out of per-block cached ASTs.
+
+    The result is the same tree a full parse would produce. If any
+    block fails to parse, the whole document is parsed again so that
+    the reported error positions refer to the original text.
+    """
+    chunks = _split_blocks(code, block_re)
+    if len(chunks) < 2:
+        return model_to_dict(mm.model_from_str(code))
+
+    try:
+        parts = [block_ast(chunk) for chunk in chunks]
+    except TextXError:
+        return model_to_dict(mm.model_from_str(code))
+
+    # Cached parts are shared, never mutate them in place
+    ast_dict = dict(parts[0])
+    ast_dict[list_attr] = [item for part in parts for item in part[list_attr]]
+    return ast_dict
+
+
+@lru_cache(maxsize=AST_CACHE_SIZE)
+def _rules_ast(code: str) -> bytes:
+    """
+    Parse rules DSL source and return the serialized AST response body.
+    """
+    ast_dict = _incremental_ast(
+        code,
+        get_event_rules_mm(),
+        _RULES_BLOCK_RE,
+        _rules_block_ast,
+        "forms",
+    )
+    return _dumps({"ok": True, "ast": ast_dict})
+
+
+@lru_cache(maxsize=AST_CACHE_SIZE)
+def _events_ast(code: str) -> bytes:
+    """
+    Parse events DSL source and return the serialized AST response body.
+    """
+    ast_dict = _incremental_ast(
+        code,
+        get_event_mm(),
+        _EVENTS_BLOCK_RE,
+        _events_block_ast,
+        "events",
+    )
+    return _dumps({"ok": True, "ast": ast_dict})
 
 
 # ------------------------------------------------------------------
@@ -226,7 +381,7 @@ def on_startup():
 
 
 @app.get("/")
-def root():
+async def root():
     """
     Simple root endpoint to verify that the API is online.
     """
@@ -241,19 +396,75 @@ def root():
 # ------------------------------------------------------------------
 
 
+# Serialized form configuration per requester_type, tagged with the
+# form_fields fingerprint it was built from. Rules are written by the
+# Rules IDE (another process), so the fingerprint is re-checked on
+# every request instead of relying on in-process invalidation.
+_form_cache: Dict[str, Tuple[Any, Optional[bytes]]] = {}
+
+
+def _build_form_config(requester_type: str) -> Optional[bytes]:
+    """
+    Build the JSON body (a list of FormField objects) with the visible
+    form fields for a requester_type.
+    Returns None when no rules are stored for it.
+    """
+    rules = get_form_rules_for_requester(requester_type)
+    if not rules:
+        return None
+
+    fields: List[Dict[str, Any]] = []
+
+    # options arrive already decoded from the DB layer
+    for field_name, visible, required, label, options in rules:
+        if not visible:
+            # Fields marked as not visible are not sent to the frontend
+            continue
+
+        label_final = label or field_name
+
+        # Rows come from our own DB, skip pydantic validation
+        fields.append(
+            {
+                "field_name": field_name,
+                "label": label_final,
+                "visible": bool(visible),
+                "required": bool(required),
+                "options": options,
+            }
+        )
+
+    return _dumps(fields)
+
+
+def _cached_form_config(requester_type: str) -> Optional[bytes]:
+    """
+    Return the form configuration for a requester_type, rebuilding it
+    only when the stored rules have changed since it was cached.
+    """
+    fingerprint = form_rules_fingerprint()
+    cached = _form_cache.get(requester_type)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    body = _build_form_config(requester_type)
+    _form_cache[requester_type] = (fingerprint, body)
+    return body
+
+
 @app.get("/form-config", response_model=List[FormField])
-def get_form_config(requester_type: str):
+async def get_form_config(requester_type: str):
     """
     Returns the form configuration for a given requester_type
     (e.g., Academics or Students), based on the rules DSL
     already parsed and stored in the database.
     """
-    if requester_type not in ("Academics", "Students"):
+    if requester_type not in REQUESTER_TYPES:
         raise HTTPException(status_code=400, detail="Invalid requester_type")
 
-    rules = get_form_rules_for_requester(requester_type)
+    body = await run_in_threadpool(_cached_form_config, requester_type)
 
-    if not rules:
+    if body is None:
         raise HTTPException(
             status_code=404,
             detail=(
@@ -262,30 +473,8 @@ def get_form_config(requester_type: str):
             ),
         )
 
-    fields: List[FormField] = []
-    import json
-
-    for field_name, visible, required, label, options_json in rules:
-        if not visible:
-            # Fields marked as not visible are not sent to the frontend
-            continue
-
-        label_final = label or field_name
-        options = None
-        if options_json:
-            options = json.loads(options_json)
-
-        fields.append(
-            FormField(
-                field_name=field_name,
-                label=label_final,
-                visible=bool(visible),
-                required=bool(required),
-                options=options,
-            )
-        )
-
-    return fields
+    # Cached body is already serialized: no response_model validation
+    return Response(content=body, media_type="application/json")
 
 
 # ------------------------------------------------------------------
@@ -293,39 +482,83 @@ def get_form_config(requester_type: str):
 # ------------------------------------------------------------------
 
 
-@app.get("/events", response_model=List[EventOut])
-def get_events():
+# Column order of db.list_events() rows, named as in EventOut
+EVENT_COLUMNS = (
+    "id",
+    "name",
+    "requester_type",
+    "date",
+    "start_time",
+    "end_time",
+    "location",
+    "requester_unit",
+)
+
+
+def _stream_events():
+    """
+    Yield the JSON array of all events chunk by chunk, one chunk per
+    batch of rows read from the cursor.
+
+    StreamingResponse advances a sync generator with one threadpool call
+    per chunk, so successive batches may be read from different threads:
+    the cursor uses its own connection instead of the thread-local one.
+    """
+    conn = connect()
+    try:
+        yield b"["
+        first = True
+        for rows in iter_event_batches(conn=conn):
+            chunk = b",".join(_dumps(dict(zip(EVENT_COLUMNS, row))) for row in rows)
+            yield chunk if first else b"," + chunk
+            first = False
+        yield b"]"
+    finally:
+        conn.close()
+
+
+@app.get(
+    "/events",
+    response_model=None,
+    responses={200: {"model": List[EventOut]}},
+)
+async def get_events():
     """
     Returns the list of all stored events.
+
+    Rows are streamed straight from the SQLite cursor as JSON (documented
+    as EventOut), so memory use does not grow with the table size and no
+    per-row pydantic validation is done.
     """
-    rows = list_events()
-    events: List[EventOut] = []
-    for ev in rows:
-        ev_id, name, requester_type, date, start, end, location, requester_unit = ev
-        events.append(
-            EventOut(
-                id=ev_id,
-                name=name,
-                requester_type=requester_type,
-                date=date,
-                start_time=start,
-                end_time=end,
-                location=location,
-                requester_unit=requester_unit,
-            )
-        )
-    return events
+    return StreamingResponse(_stream_events(), media_type="application/json")
+
+
+def _audit_event_created(event_id: int, payload: EventCreate):
+    """
+    Record a newly created event in the API log (runs as a background task).
+    """
+    logger.info(
+        "Event %s created: %r on %s %s-%s (%s @ %s)",
+        event_id,
+        payload.name,
+        payload.date,
+        payload.start_time,
+        payload.end_time,
+        payload.requester_type,
+        payload.location,
+    )
 
 
 @app.post("/events", response_model=EventOut, status_code=201)
-def create_event(payload: EventCreate):
+async def create_event(payload: EventCreate, background_tasks: BackgroundTasks):
     """
     Validates an event using scheduling rules and, if valid,
     stores it in the database and returns the created record.
     """
     # Domain-specific scheduling validation (DSL-based constraints)
     try:
-        validate_event_scheduling(
+        await run_in_threadpool(
+            validate_event_scheduling,
             name=payload.name,
             requester_type=payload.requester_type,
             date=payload.date,
@@ -338,7 +571,8 @@ def create_event(payload: EventCreate):
 
     # Persist in DB
     try:
-        save_event(
+        new_id = await run_in_threadpool(
+            save_event,
             name=payload.name,
             requester_type=payload.requester_type,
             date=payload.date,
@@ -353,20 +587,15 @@ def create_event(payload: EventCreate):
             detail=f"Database error: {e}",
         )
 
-    # Return the last inserted event (simple approach)
-    rows = list_events()
-    last = rows[-1]
-    ev_id, name, requester_type, date, start, end, location, requester_unit = last
-
-    return EventOut(
-        id=ev_id,
-        name=name,
-        requester_type=requester_type,
-        date=date,
-        start_time=start,
-        end_time=end,
-        location=location,
-        requester_unit=requester_unit,
+    # Anything not needed for the 201 payload runs after the response
+    background_tasks.add_task(_audit_event_created, new_id, payload)
+
+    # The stored row is exactly the validated payload plus its new id,
+    # so there is nothing left to validate (EventOut documents the shape)
+    return Response(
+        content=_dumps({"id": new_id, **payload.model_dump()}),
+        status_code=201,
+        media_type="application/json",
     )
 
 
@@ -376,7 +605,7 @@ def create_event(payload: EventCreate):
 
 
 @app.post("/rules-ast")
-def get_rules_ast(payload: AstRequest):
+async def get_rules_ast(payload: AstRequest):
     """
     Parses the EVENT RULES DSL (event_rules_dsl.tx) from raw text and returns
     the corresponding abstract syntax tree (AST) as a JSON structure.
@@ -385,9 +614,11 @@ def get_rules_ast(payload: AstRequest):
     how the DSL rules are interpreted by textX.
     """
     try:
-        model = event_rules_mm.model_from_str(payload.code)
-        ast_dict = model_to_dict(model)
-        return {"ok": True, "ast": ast_dict}
+        # Parsing is CPU-bound, keep it off the event loop
+        body = await anyio.to_thread.run_sync(
+            _rules_ast, payload.code, limiter=_parse_limiter
+        )
+        return Response(content=body, media_type="application/json")
     except TextXError as e:
         # Grammar or semantic errors during parsing
         raise HTTPException(
@@ -403,7 +634,7 @@ def get_rules_ast(payload: AstRequest):
 
 
 @app.post("/events-ast")
-def get_events_ast(payload: AstRequest):
+async def get_events_ast(payload: AstRequest):
     """
     Parses the EVENTS DSL (event_dsl.tx) from raw text and returns
     the corresponding abstract syntax tree (AST) as a JSON structure.
@@ -412,9 +643,11 @@ def get_events_ast(payload: AstRequest):
     and how textX instantiates the model.
     """
     try:
-        model = event_mm.model_from_str(payload.code)
-        ast_dict = model_to_dict(model)
-        return {"ok": True, "ast": ast_dict}
+        # Parsing is CPU-bound, keep it off the event loop
+        body = await anyio.to_thread.run_sync(
+            _events_ast, payload.code, limiter=_parse_limiter
+        )
+        return Response(content=body, media_type="application/json")
     except TextXError as e:
         # Grammar or semantic errors during parsing
         raise HTTPException(
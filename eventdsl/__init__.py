@@ -0,0 +1,3 @@
+"""
+Event Scheduler DSL: textX grammars, parsers, SQLite storage and GUIs.
+"""
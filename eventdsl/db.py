@@ -1,19 +1,223 @@
+import atexit
 import sqlite3
 import os
 import json
-from typing import Optional, List
+import threading
+from contextlib import contextmanager
+from itertools import islice
+from typing import Iterable, List, Optional, Tuple
+
+# Opcional: codificador JSON en C para la columna options_json
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "events.db")
 
+# Sentencias SQL de uso frecuente. Se definen una sola vez para que la
+# conexión persistente reutilice su caché de sentencias preparadas.
+_SQL_INSERT_EVENT = """
+    INSERT INTO events (name, requester_type, date, start_time, end_time, location, requester_unit)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_INSERT_EVENTS_PREFIX = (
+    "INSERT INTO events (name, requester_type, date, start_time, end_time, "
+    "location, requester_unit) VALUES "
+)
+
+_SQL_LIST_EVENTS = """
+    SELECT id, name, requester_type, date, start_time, end_time, location, requester_unit
+    FROM events
+    ORDER BY date, start_time
+"""
+
+_SQL_EVENTS_FOR_DATE_LOCATION = """
+    SELECT id, name, requester_type, date, start_time, end_time, location, requester_unit
+    FROM events
+    WHERE date = ?
+      AND location = ?
+    ORDER BY start_time
+"""
+
+# Minutos desde 00:00 de una columna 'HH:MM' (acepta horas sin cero inicial)
+_SQL_MINUTES = (
+    "(CAST(substr({col}, 1, instr({col}, ':') - 1) AS INTEGER) * 60"
+    " + CAST(substr({col}, instr({col}, ':') + 1) AS INTEGER))"
+)
+
+# Traslape si NO se cumple: new_end <= ev_start OR new_start >= ev_end
+_SQL_CONFLICTING_EVENTS = f"""
+    SELECT id, name, requester_type, date, start_time, end_time, location, requester_unit
+    FROM events
+    WHERE date = ?
+      AND location = ?
+      AND {_SQL_MINUTES.format(col="start_time")} < ?
+      AND {_SQL_MINUTES.format(col="end_time")} > ?
+    ORDER BY {_SQL_MINUTES.format(col="start_time")}
+"""
+
+# Además de las columnas de evento regresa start_min/end_min ya calculados,
+# ordenados por start_min (el orden textual de start_time falla con '9:00').
+# Con JOIN sobre VALUES cada par se busca en idx_events_date_location_min y
+# solo se ordenan las filas encontradas; con (date, location) IN (VALUES ...)
+# SQLite prefiere recorrer el índice completo para evitar ese ordenamiento.
+_SQL_EVENTS_FOR_DATE_LOCATION_BATCH = f"""
+    SELECT e.id, e.name, e.requester_type, e.date, e.start_time, e.end_time,
+           e.location, e.requester_unit,
+           {_SQL_MINUTES.format(col="e.start_time")} AS start_min,
+           {_SQL_MINUTES.format(col="e.end_time")} AS end_min
+    FROM (VALUES {{values}}) AS k
+    JOIN events AS e ON e.date = k.column1 AND e.location = k.column2
+    ORDER BY e.date, e.location, start_min
+"""
+
+# Índice sobre la misma expresión de minutos que usan las consultas de
+# conflictos: el rango sobre start_time y el ORDER BY salen del índice.
+# (SQLite solo usa un índice de expresión si la consulta la escribe igual.)
+_SQL_CREATE_EVENTS_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_events_date_location_min "
+    f"ON events (date, location, {_SQL_MINUTES.format(col='start_time')})"
+)
+
+_SQL_CREATE_FORM_FIELDS_INDEX = (
+    "CREATE INDEX IF NOT EXISTS idx_form_fields_requester "
+    "ON form_fields (requester_type, id)"
+)
+
+_SQL_DROP_FORM_FIELDS_INDEX = "DROP INDEX IF EXISTS idx_form_fields_requester"
+
+_SQL_CLEAR_FORM_RULES = "DELETE FROM form_fields"
+
+_SQL_INSERT_FORM_FIELD = """
+    INSERT INTO form_fields (requester_type, field_name, visible, required, label, options_json)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+_SQL_LIST_FORM_RULES = """
+    SELECT requester_type, field_name, visible, required, label, options_json
+    FROM form_fields
+    ORDER BY requester_type, field_name
+"""
+
+_SQL_FORM_RULES_FOR_REQUESTER = """
+    SELECT field_name, visible, required, label, options_json
+    FROM form_fields
+    WHERE requester_type = ?
+    ORDER BY id
+"""
+
+# Reglas actuales en orden de inserción (el orden de los campos del form)
+_SQL_FORM_RULES_BY_ID = """
+    SELECT id, requester_type, field_name, visible, required, label, options_json
+    FROM form_fields
+    ORDER BY id
+"""
+
+_SQL_DELETE_FORM_FIELD = "DELETE FROM form_fields WHERE id = ?"
+
+# Hash del texto DSL con el que se cargaron las reglas actuales (una sola fila)
+_SQL_GET_FORM_RULES_SOURCE = (
+    "SELECT text_hash, form_count FROM form_rules_source WHERE id = 1"
+)
+
+_SQL_SET_FORM_RULES_SOURCE = (
+    "INSERT OR REPLACE INTO form_rules_source (id, text_hash, form_count) "
+    "VALUES (1, ?, ?)"
+)
+
+_SQL_CLEAR_FORM_RULES_SOURCE = "DELETE FROM form_rules_source"
+
+# Cambia cada vez que se reescriben las reglas (AUTOINCREMENT nunca reusa ids)
+_SQL_FORM_RULES_FINGERPRINT = "SELECT COUNT(*), MAX(id) FROM form_fields"
+
+# Sentencias preparadas que guarda cada conexión
+STATEMENT_CACHE_SIZE = 256
+
+# Una conexión por hilo (FastAPI ejecuta los handlers sync en un threadpool)
+_tls = threading.local()
+_all_conns = []
+_all_conns_lock = threading.Lock()
+
+
+def connect():
+    """
+    Abre una conexión nueva con los ajustes del módulo. Quien la pide es
+    responsable de cerrarla (get_conn es la compartida por hilo).
+    """
+    # cached_statements: los INSERT multi-fila generan varias sentencias
+    # distintas; con 256 (default 128) todas siguen preparadas
+    conn = sqlite3.connect(
+        DB_PATH,
+        check_same_thread=False,
+        cached_statements=STATEMENT_CACHE_SIZE,
+    )
+    # Ajustes por conexión (journal_mode=WAL es persistente, ver init_db)
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA temp_store=MEMORY")
+    conn.execute("PRAGMA cache_size=-64000")
+    return conn
+
 
 def get_conn():
-    return sqlite3.connect(DB_PATH)
+    """
+    Devuelve la conexión del hilo actual, creándola la primera vez.
+    Las conexiones se reutilizan entre llamadas y se cierran al salir.
+    """
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        conn = connect()
+        _tls.conn = conn
+        with _all_conns_lock:
+            _all_conns.append(conn)
+    return conn
+
+
+@contextmanager
+def transaction():
+    """
+    Transacción explícita sobre la conexión del hilo: BEGIN IMMEDIATE al
+    entrar, COMMIT al salir (ROLLBACK si hay error). IMMEDIATE toma el
+    candado de escritura desde el inicio, así otro proceso (p. ej. el
+    Rules IDE) no puede quedar a media transacción compitiendo por él.
+    """
+    conn = get_conn()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+@atexit.register
+def _close_all_conns():
+    with _all_conns_lock:
+        for conn in _all_conns:
+            conn.close()
+        _all_conns.clear()
+
+
+# Bases de datos cuyo esquema ya se creó en este proceso
+_initialized_paths = set()
 
 
 def init_db():
+    """
+    Crea el esquema e índices si no existen. Solo trabaja la primera vez
+    por proceso (y por DB_PATH); las siguientes llamadas no hacen nada.
+    """
+    if DB_PATH in _initialized_paths:
+        return
+
     conn = get_conn()
     cursor = conn.cursor()
 
+    # WAL queda guardado en el archivo de la BD, basta con fijarlo una vez
+    cursor.execute("PRAGMA journal_mode=WAL")
+
     cursor.execute(
         """
         CREATE TABLE IF NOT EXISTS events (
@@ -44,8 +248,24 @@ def init_db():
         """
     )
 
+    # Origen de las reglas actuales: hash del texto DSL aplicado por
+    # save_form_field_rules_bulk (se borra si las reglas cambian por otra vía)
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS form_rules_source (
+            id INTEGER PRIMARY KEY CHECK (id = 1),
+            text_hash BLOB NOT NULL,
+            form_count INTEGER NOT NULL
+        )
+        """
+    )
+
+    # Índices para las búsquedas de conflictos y de reglas por requester
+    cursor.execute(_SQL_CREATE_EVENTS_INDEX)
+    cursor.execute(_SQL_CREATE_FORM_FIELDS_INDEX)
+
     conn.commit()
-    conn.close()
+    _initialized_paths.add(DB_PATH)
 
 
 # ---------- Eventos ----------
@@ -58,35 +278,97 @@ def save_event(
     end_time: str,
     location: str,
     requester_unit: Optional[str] = None,
-):
+) -> int:
+    """
+    Inserta un evento y devuelve su id.
+    """
     conn = get_conn()
     cursor = conn.cursor()
     cursor.execute(
-        """
-        INSERT INTO events (name, requester_type, date, start_time, end_time, location, requester_unit)
-        VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+        _SQL_INSERT_EVENT,
         (name, requester_type, date, start_time, end_time, location, requester_unit),
     )
     conn.commit()
-    conn.close()
+    return cursor.lastrowid
+
+
+# Filas por sentencia en save_events_multirow (7 parámetros por fila)
+EVENTS_MULTIROW_CHUNK = 50
+
+
+def save_events_multirow(
+    rows: Iterable[
+        Tuple[str, str, str, str, str, str, Optional[str]]
+    ],
+    chunk: int = EVENTS_MULTIROW_CHUNK,
+):
+    """
+    Inserta varios eventos en una sola transacción, hasta `chunk` filas por
+    sentencia con un INSERT ... VALUES (...), (...), ...
+    Cada fila: (name, requester_type, date, start_time, end_time, location,
+    requester_unit).
+    """
+    rows = list(rows)
+    if not rows:
+        return
+
+    conn = get_conn()
+    try:
+        for start in range(0, len(rows), chunk):
+            batch = rows[start:start + chunk]
+            sql = _SQL_INSERT_EVENTS_PREFIX + ", ".join(
+                ["(?, ?, ?, ?, ?, ?, ?)"] * len(batch)
+            )
+            conn.execute(sql, [value for row in batch for value in row])
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
 
 
 def list_events():
     conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT id, name, requester_type, date, start_time, end_time, location, requester_unit
-        FROM events
-        ORDER BY date, start_time
-        """
-    )
+    cursor.execute(_SQL_LIST_EVENTS)
     rows = cursor.fetchall()
-    conn.close()
     return rows
 
 
+def iter_events(conn: Optional[sqlite3.Connection] = None):
+    """
+    Igual que list_events, pero entrega las filas una a una desde el
+    cursor, sin materializar la lista completa. Por defecto usa la
+    conexión del hilo; un generador que se consume desde varios hilos
+    debe pasar su propia conexión (ver connect).
+    """
+    if conn is None:
+        conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute(_SQL_LIST_EVENTS)
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+def iter_event_batches(
+    batch_size: int = 500, conn: Optional[sqlite3.Connection] = None
+):
+    """
+    Igual que iter_events, pero entrega las filas en listas de hasta
+    batch_size (memoria acotada para listados grandes).
+    """
+    rows = iter_events(conn)
+    try:
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            yield batch
+    finally:
+        rows.close()
+
+
 def get_events_for_date_location(date: str, location: str):
     """
     Eventos ya agendados para una fecha/location.
@@ -94,29 +376,119 @@ def get_events_for_date_location(date: str, location: str):
     """
     conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT id, name, requester_type, date, start_time, end_time, location, requester_unit
-        FROM events
-        WHERE date = ?
-          AND location = ?
-        ORDER BY start_time
-        """,
-        (date, location),
-    )
+    cursor.execute(_SQL_EVENTS_FOR_DATE_LOCATION, (date, location))
+    rows = cursor.fetchall()
+    return rows
+
+
+def get_conflicting_events(date: str, location: str, start_min: int, end_min: int):
+    """
+    Eventos en la misma fecha/location que se traslapan con el rango
+    [start_min, end_min) (minutos desde 00:00). El filtro se hace en SQL.
+    """
+    conn = get_conn()
+    cursor = conn.cursor()
+    cursor.execute(_SQL_CONFLICTING_EVENTS, (date, location, end_min, start_min))
     rows = cursor.fetchall()
-    conn.close()
     return rows
 
 
+# Pares (date, location) por consulta: 2 parámetros por par, debajo del
+# límite de 999 variables de SQLite
+DATE_LOCATION_BATCH = 400
+
+
+def get_events_for_date_location_batch(pairs: Iterable[Tuple[str, str]]):
+    """
+    Eventos ya agendados para varios pares (date, location) con una sola
+    consulta por lote. Devuelve un dict {(date, location): [filas]} con
+    todos los pares pedidos (lista vacía si no hay eventos).
+    Cada fila trae las columnas de evento más start_min y end_min
+    (minutos desde 00:00) y las listas vienen ordenadas por start_min.
+    """
+    pairs = list(dict.fromkeys(pairs))
+    result = {pair: [] for pair in pairs}
+    if not pairs:
+        return result
+
+    conn = get_conn()
+    for start in range(0, len(pairs), DATE_LOCATION_BATCH):
+        batch = pairs[start:start + DATE_LOCATION_BATCH]
+        sql = _SQL_EVENTS_FOR_DATE_LOCATION_BATCH.format(
+            values=", ".join(["(?, ?)"] * len(batch))
+        )
+        params = [value for pair in batch for value in pair]
+        for row in conn.execute(sql, params):
+            result[(row[3], row[6])].append(row)
+    return result
+
+
 # ---------- Reglas de formulario ----------
 
+# Caché de lecturas de form_fields. Cada hilo guarda la suya junto con
+# (PRAGMA data_version, _form_rules_generation):
+# - data_version cambia cuando OTRA conexión (p. ej. el Rules IDE, que es
+#   otro proceso) hace commit en la BD.
+# - _form_rules_generation cambia cuando este proceso escribe reglas.
+_form_rules_generation = 0
+
+
+def _invalidate_form_rules_cache():
+    global _form_rules_generation
+    _form_rules_generation += 1
+
+
+def _form_rules_cache():
+    conn = get_conn()
+    data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+    stamp = (data_version, _form_rules_generation)
+    cache = getattr(_tls, "form_rules_cache", None)
+    if cache is None or cache[0] != stamp:
+        cache = (stamp, {})
+        _tls.form_rules_cache = cache
+    return cache[1]
+
+
+def _cached_form_rules_query(sql: str, params: tuple = (), decode=None):
+    cache = _form_rules_cache()
+    key = (sql, params)
+    rows = cache.get(key)
+    if rows is None:
+        rows = get_conn().execute(sql, params).fetchall()
+        if decode is not None:
+            rows = [decode(row) for row in rows]
+        cache[key] = rows
+    # Copia: los llamadores pueden modificar la lista que reciben
+    return list(rows)
+
+
+def _dump_options(options: Optional[List[str]]) -> Optional[str]:
+    # JSON compacto (sin espacios); acepta cualquier secuencia, p. ej. la
+    # lista de textX tal cual, sin copiarla antes. Se guarda como TEXT
+    # (con orjson se decodifica el bytes) para que list_form_rules siga
+    # entregando str.
+    if options is None:
+        return None
+    if orjson is not None:
+        return orjson.dumps(options).decode()
+    return json.dumps(options, separators=(",", ":"))
+
+
+def _load_options(options_json: Optional[str]) -> Optional[List[str]]:
+    if not options_json:
+        return None
+    if orjson is not None:
+        return orjson.loads(options_json)
+    return json.loads(options_json)
+
+
 def clear_form_rules():
     conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute("DELETE FROM form_fields")
+    cursor.execute(_SQL_CLEAR_FORM_RULES)
+    cursor.execute(_SQL_CLEAR_FORM_RULES_SOURCE)
     conn.commit()
-    conn.close()
+    _invalidate_form_rules_cache()
 
 
 def save_form_field_rule(
@@ -129,56 +501,185 @@ def save_form_field_rule(
 ):
     conn = get_conn()
     cursor = conn.cursor()
-    options_json = json.dumps(options) if options is not None else None
+    options_json = _dump_options(options)
+
+    # visible/required son bool (subclase de int): sqlite3 los guarda como 1/0
 
     cursor.execute(
-        """
-        INSERT INTO form_fields (requester_type, field_name, visible, required, label, options_json)
-        VALUES (?, ?, ?, ?, ?, ?)
-        """,
+        _SQL_INSERT_FORM_FIELD,
         (
             requester_type,
             field_name,
-            1 if visible else 0,
-            1 if required else 0,
+            visible,
+            required,
             label,
             options_json,
         ),
     )
+    cursor.execute(_SQL_CLEAR_FORM_RULES_SOURCE)
     conn.commit()
-    conn.close()
+    _invalidate_form_rules_cache()
 
 
-def list_form_rules():
+FormRuleRow = Tuple[str, str, bool, bool, Optional[str], Optional[List[str]]]
+
+
+def _encode_form_rule_rows(rows: Iterable[FormRuleRow]):
+    # visible/required son bool (subclase de int): sqlite3 los guarda como 1/0.
+    # Las mismas opciones suelen repetirse en varios forms (p. ej. location
+    # en Academics y Students): cada lista distinta se codifica una sola vez
+    # y las filas comparten el mismo str.
+    encoded = {}
+    for requester_type, field_name, visible, required, label, options in rows:
+        if options is None:
+            options_json = None
+        else:
+            key = tuple(options)
+            options_json = encoded.get(key)
+            if options_json is None:
+                options_json = encoded[key] = _dump_options(options)
+        yield (
+            requester_type,
+            field_name,
+            visible,
+            required,
+            label,
+            options_json,
+        )
+
+
+def _form_rules_delta(current, new_rows):
+    """
+    Diferencia entre las filas actuales (con id, en orden de id) y las
+    nuevas (ya codificadas). Devuelve (ids a borrar, filas a insertar) si
+    basta con borrar filas y agregar otras al final conservando el orden
+    de los campos; None si hay que reescribir la tabla completa.
+    """
+    new_set = set(new_rows)
+    if len(new_set) != len(new_rows):
+        return None
+
+    kept = []
+    delete_ids = []
+    for row in current:
+        values = tuple(row[1:])
+        if values in new_set:
+            kept.append(values)
+        else:
+            delete_ids.append(row[0])
+
+    # Las filas que se quedan deben ser, en orden, el inicio de las nuevas
+    # (valores repetidos en la tabla tampoco se pueden conservar así)
+    if kept != new_rows[:len(kept)]:
+        return None
+    return delete_ids, new_rows[len(kept):]
+
+
+def save_form_field_rules_bulk(
+    rows: Iterable[FormRuleRow],
+    source: Optional[Tuple[bytes, int]] = None,
+):
+    """
+    Reemplaza todas las reglas de formulario de forma atómica, en una sola
+    transacción (BEGIN IMMEDIATE) y un solo commit.
+    Si algo falla, las reglas anteriores (y el índice) quedan intactos.
+    Cada fila: (requester_type, field_name, visible, required, label, options).
+
+    Si las reglas nuevas solo quitan filas y/o agregan otras al final
+    (respecto al orden actual), se aplica únicamente esa diferencia: DELETE
+    por id + INSERT de las filas nuevas, con el índice en su lugar.
+
+    Solo cuando _form_rules_delta devuelve None se reescribe la tabla
+    completa (DELETE + executemany). En ese caso el índice por
+    requester_type se quita antes de insertar y se vuelve a crear al final:
+    construirlo una vez sobre la tabla completa sale más barato que
+    actualizarlo fila por fila, y como todo ocurre dentro de la
+    transacción ninguna lectura ve la tabla sin índice.
+
+    source: (hash del texto DSL, nº de forms) de donde salieron las filas;
+    queda registrado en la misma transacción (ver get_form_rules_source).
+    """
+    new_rows = list(_encode_form_rule_rows(rows))
+
+    with transaction() as conn:
+        current = conn.execute(_SQL_FORM_RULES_BY_ID).fetchall()
+        delta = _form_rules_delta(current, new_rows)
+        if delta is None:
+            conn.execute(_SQL_CLEAR_FORM_RULES)
+            conn.execute(_SQL_DROP_FORM_FIELDS_INDEX)
+            conn.executemany(_SQL_INSERT_FORM_FIELD, new_rows)
+            conn.execute(_SQL_CREATE_FORM_FIELDS_INDEX)
+        else:
+            delete_ids, insert_rows = delta
+            conn.executemany(_SQL_DELETE_FORM_FIELD, [(i,) for i in delete_ids])
+            conn.executemany(_SQL_INSERT_FORM_FIELD, insert_rows)
+        if source is not None:
+            conn.execute(_SQL_SET_FORM_RULES_SOURCE, source)
+        else:
+            conn.execute(_SQL_CLEAR_FORM_RULES_SOURCE)
+    _invalidate_form_rules_cache()
+
+
+def iter_form_rules():
+    """
+    Igual que list_form_rules, pero entrega las filas una a una desde el
+    cursor (sin caché ni lista completa), para listados grandes.
+    """
     conn = get_conn()
     cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT requester_type, field_name, visible, required, label, options_json
-        FROM form_fields
-        ORDER BY requester_type, field_name
-        """
-    )
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
+    cursor.execute(_SQL_LIST_FORM_RULES)
+    try:
+        yield from cursor
+    finally:
+        cursor.close()
+
+
+def get_form_rules_source() -> Optional[Tuple[bytes, int]]:
+    """
+    (hash del texto DSL, nº de forms) con el que se cargaron las reglas
+    actuales, o None si se modificaron por otra vía.
+    No requiere init_db: si la tabla aún no existe también devuelve None,
+    y si el archivo de la base aún no existe ni siquiera se conecta (así
+    una consulta no deja creado un events.db vacío).
+    """
+    if not os.path.exists(DB_PATH):
+        return None
+    try:
+        row = get_conn().execute(_SQL_GET_FORM_RULES_SOURCE).fetchone()
+    except sqlite3.OperationalError:
+        return None
+    return tuple(row) if row is not None else None
+
+
+def list_form_rules():
+    return _cached_form_rules_query(_SQL_LIST_FORM_RULES)
+
+
+def _decode_requester_rule(row):
+    field_name, visible, required, label, options_json = row
+    options = _load_options(options_json)
+    return (field_name, visible, required, label, options)
 
 
 def get_form_rules_for_requester(requester_type: str):
     """
     Reglas de campos visibles para un requester_type (Academics/Students).
+    Cada fila: (field_name, visible, required, label, options), con options
+    ya decodificado como lista (o None).
+    El resultado se memoriza hasta que las reglas cambian.
     """
-    conn = get_conn()
-    cursor = conn.cursor()
-    cursor.execute(
-        """
-        SELECT field_name, visible, required, label, options_json
-        FROM form_fields
-        WHERE requester_type = ?
-        ORDER BY id
-        """,
+    return _cached_form_rules_query(
+        _SQL_FORM_RULES_FOR_REQUESTER,
         (requester_type,),
+        decode=_decode_requester_rule,
     )
-    rows = cursor.fetchall()
-    conn.close()
-    return rows
+
+
+def form_rules_fingerprint():
+    """
+    Huella barata del contenido de form_fields.
+    Sirve para invalidar cachés de reglas, incluso si otro proceso
+    (p. ej. el Rules IDE) las modificó.
+    """
+    conn = get_conn()
+    return conn.execute(_SQL_FORM_RULES_FINGERPRINT).fetchone()
@@ -1,24 +1,40 @@
-import json
+import datetime
 import tkinter as tk
 from tkinter import ttk, messagebox
-from typing import Optional
+from typing import List, Optional
 
-from db import (
+from ..db import (
     init_db,
     get_form_rules_for_requester,
     save_event,
 )
 
-from validators.scheduling import (
+from ..validators.scheduling import (
     validate_event_scheduling,
     SchedulingValidationError,
 )
 
-# Opcional: calendario
-try:
-    from tkcalendar import DateEntry
-except ImportError:
-    DateEntry = None
+# Opcional: calendario. tkcalendar se importa hasta que se dibuja el
+# primer campo de fecha (no al importar el módulo); _DateEntry guarda el
+# resultado: la clase, None si no está instalado, o _UNSET si aún no se buscó.
+_UNSET = object()
+_DateEntry = _UNSET
+
+
+def _get_date_entry():
+    global _DateEntry
+    if _DateEntry is _UNSET:
+        try:
+            from tkcalendar import DateEntry
+        except ImportError:
+            DateEntry = None
+        _DateEntry = DateEntry
+    return _DateEntry
+
+
+# Opciones fijas del TimePicker (se calculan una sola vez)
+_HOURS = tuple(f"{h:02d}" for h in range(0, 24))
+_MINUTES = tuple(f"{m:02d}" for m in range(0, 60, 15))  # cada 15 minutos
 
 
 class TimePicker(ttk.Frame):
@@ -29,16 +45,14 @@ class TimePicker(ttk.Frame):
     def __init__(self, parent, default_hour: str = "08", default_minute: str = "00"):
         super().__init__(parent)
 
+        self._defaults = (default_hour, default_minute)
         self.hour_var = tk.StringVar(value=default_hour)
         self.min_var = tk.StringVar(value=default_minute)
 
-        hours = [f"{h:02d}" for h in range(0, 24)]
-        minutes = [f"{m:02d}" for m in range(0, 60, 15)]  # cada 15 minutos
-
         self.hour_cb = ttk.Combobox(
             self,
             textvariable=self.hour_var,
-            values=hours,
+            values=_HOURS,
             width=3,
             state="readonly",
         )
@@ -47,7 +61,7 @@ class TimePicker(ttk.Frame):
         self.min_cb = ttk.Combobox(
             self,
             textvariable=self.min_var,
-            values=minutes,
+            values=_MINUTES,
             width=3,
             state="readonly",
         )
@@ -64,6 +78,10 @@ class TimePicker(ttk.Frame):
         self.hour_var.set("")
         self.min_var.set("")
 
+    def restore_defaults(self):
+        self.hour_var.set(self._defaults[0])
+        self.min_var.set(self._defaults[1])
+
 
 class AddEventApp(tk.Tk):
     def __init__(self):
@@ -73,6 +91,12 @@ class AddEventApp(tk.Tk):
 
         self.current_fields = {}   # field_name -> widget
         self.current_rules = []    # cache de reglas
+        self.required_visible_fields = set()  # se calcula al cargar el form
+
+        # Widgets ya creados, ocultos con grid_remove y reutilizados al
+        # recargar el form: (field_name, tipo) -> (label, widget)
+        self._widget_pool = {}
+        self._no_rules_label = None
 
         self._create_widgets()
 
@@ -122,10 +146,16 @@ class AddEventApp(tk.Tk):
     # ---------------- Helpers formulario ---------------- #
 
     def clear_form(self):
-        for child in self.form_frame.winfo_children():
-            child.destroy()
+        # Los widgets de campo se ocultan (quedan en el pool), no se destruyen
+        for lbl, widget in self._widget_pool.values():
+            lbl.grid_remove()
+            widget.grid_remove()
+        if self._no_rules_label is not None:
+            self._no_rules_label.destroy()
+            self._no_rules_label = None
         self.current_fields.clear()
         self.current_rules.clear()
+        self.required_visible_fields = set()
 
     def load_form_for_current_requester(self):
         self.clear_form()
@@ -134,33 +164,42 @@ class AddEventApp(tk.Tk):
         rules = get_form_rules_for_requester(requester_type)
 
         if not rules:
-            ttk.Label(
+            self._no_rules_label = ttk.Label(
                 self.form_frame,
                 text="No form rules found for this requester type.\n"
                      "Ask the admin to configure the DSL rules.",
                 foreground="red",
-            ).pack(pady=20)
+            )
+            self._no_rules_label.grid(row=0, column=0, columnspan=2, pady=20)
             return
 
         self.current_rules = rules
 
         row_index = 0
-        for (field_name, visible, required, label, options_json) in rules:
+        for (field_name, visible, required, label, options) in rules:
             if not visible:
                 continue
 
             field_label = label if label else field_name
+            label_text = field_label + (":" if not field_label.endswith(":") else "")
+
+            kind = self._field_kind(field_name, options)
+            pooled = self._widget_pool.get((field_name, kind))
+            if pooled is None:
+                lbl = ttk.Label(self.form_frame, text=label_text)
+                widget = self._create_widget_for_field(
+                    field_name=field_name,
+                    options=options,
+                )
+                self._widget_pool[(field_name, kind)] = (lbl, widget)
+            else:
+                lbl, widget = pooled
+                lbl.configure(text=label_text)
+                if kind == "combo":
+                    widget.configure(values=options)
+                self._restore_widget(kind, widget)
 
-            lbl = ttk.Label(
-                self.form_frame,
-                text=field_label + (":" if not field_label.endswith(":") else ""),
-            )
             lbl.grid(row=row_index, column=0, sticky="w", padx=5, pady=5)
-
-            widget = self._create_widget_for_field(
-                field_name=field_name,
-                options_json=options_json,
-            )
             widget.grid(row=row_index, column=1, sticky="ew", padx=5, pady=5)
 
             self.current_fields[field_name] = widget
@@ -168,14 +207,40 @@ class AddEventApp(tk.Tk):
 
         self.form_frame.columnconfigure(1, weight=1)
 
-    def _create_widget_for_field(self, field_name: str, options_json: Optional[str]):
-        options = None
-        if options_json:
-            try:
-                options = json.loads(options_json)
-            except Exception:
-                options = None
+        # Campos required visibles (fijos mientras no se recargue el form)
+        self.required_visible_fields = {
+            field_name
+            for (field_name, visible, required, _label, _options) in rules
+            if visible and required and field_name in self.current_fields
+        }
+
+    @staticmethod
+    def _field_kind(field_name: str, options: Optional[List[str]]) -> str:
+        # Mismo criterio que _create_widget_for_field; identifica en el pool
+        # qué tipo de widget corresponde a un campo
+        if options:
+            return "combo"
+        if field_name == "event_date":
+            return "date"
+        if field_name in ("start_time", "end_time"):
+            return "time"
+        return "entry"
+
+    def _restore_widget(self, kind: str, widget):
+        # Deja un widget reutilizado como recién creado
+        if kind == "combo":
+            widget.set("")
+        elif kind == "time":
+            widget.restore_defaults()
+        elif kind == "date" and hasattr(widget, "set_date"):
+            widget.set_date(datetime.date.today())
+        else:
+            widget.delete(0, tk.END)
+            if kind == "date":
+                widget.insert(0, "YYYY-MM-DD")
 
+    def _create_widget_for_field(self, field_name: str, options: Optional[List[str]]):
+        # options ya viene decodificado desde db.get_form_rules_for_requester
         if options:
             combo_var = tk.StringVar()
             combo = ttk.Combobox(
@@ -187,6 +252,7 @@ class AddEventApp(tk.Tk):
             return combo
 
         if field_name == "event_date":
+            DateEntry = _get_date_entry()
             if DateEntry is not None:
                 return DateEntry(self.form_frame, date_pattern="yyyy-mm-dd")
             else:
@@ -214,16 +280,10 @@ class AddEventApp(tk.Tk):
             val = self._get_widget_value(widget)
             values[field_name] = val
 
-        # Campos required visibles
-        required_visible_fields = set()
-        for (field_name, visible, required, _label, _options_json) in self.current_rules:
-            if visible and required and field_name in self.current_fields:
-                required_visible_fields.add(field_name)
-
         # Validación de requeridos al enviar
         missing = [
             f
-            for f in required_visible_fields
+            for f in self.required_visible_fields
             if f not in values or not str(values[f]).strip()
         ]
 
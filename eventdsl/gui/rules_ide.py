@@ -1,16 +1,7 @@
-import os
-import sys
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 
-CODE_ROOT = os.path.dirname(os.path.dirname(__file__))
-if CODE_ROOT not in sys.path:
-    sys.path.append(CODE_ROOT)
-
-from textx.exceptions import TextXError
-from parsers.rules import parse_rules_from_text
-from db import init_db, list_form_rules
-
+from ..db import init_db, list_form_rules, save_form_field_rules_bulk
 
 
 class RulesIDE(tk.Tk):
@@ -21,6 +12,12 @@ class RulesIDE(tk.Tk):
         self.geometry("1000x600")
 
         self.viewer_tree = None
+
+        # Resultado del último parseo exitoso: (filas, nº de forms).
+        # Si el editor no cambió desde entonces, no se vuelve a parsear.
+        self._dirty = True
+        self._last_compiled = None
+
         self._create_widgets()
         self.refresh_rules_view()
 
@@ -50,6 +47,7 @@ class RulesIDE(tk.Tk):
 
         self.text = tk.Text(text_frame, wrap=tk.NONE, undo=True)
         self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.bind("<<Modified>>", self._mark_dirty)
 
         scroll_y = ttk.Scrollbar(
             text_frame, orient=tk.VERTICAL, command=self.text.yview
@@ -108,6 +106,13 @@ class RulesIDE(tk.Tk):
         scroll_y2.pack(side=tk.RIGHT, fill=tk.Y)
         self.viewer_tree.configure(yscrollcommand=scroll_y2.set)
 
+    def _mark_dirty(self, _event=None):
+        # <<Modified>> se dispara una vez por cambio del flag; se resetea
+        # para enterarse del siguiente cambio (el reset vuelve a dispararlo)
+        if self.text.edit_modified():
+            self._dirty = True
+            self.text.edit_modified(False)
+
     # ------------ File operations (Editor) ------------ #
 
     def open_file(self):
@@ -122,6 +127,8 @@ class RulesIDE(tk.Tk):
                 content = f.read()
             self.text.delete("1.0", tk.END)
             self.text.insert("1.0", content)
+            self._dirty = True
+            self._last_compiled = None
         except Exception as e:
             messagebox.showerror("Error", f"Could not open file:\n{e}")
 
@@ -144,10 +151,26 @@ class RulesIDE(tk.Tk):
     # ------------ DSL operations ------------ #
 
     def validate_and_save(self):
+        # textX y el parser de reglas se cargan hasta el primer uso,
+        # así abrir el IDE no paga el costo de importarlos
+        from textx.exceptions import TextXError
+        from ..parsers.rules import compile_rules, rules_text_hash
+
         dsl_text = self.text.get("1.0", tk.END)
 
         try:
-            count = parse_rules_from_text(dsl_text)
+            if self._dirty or self._last_compiled is None:
+                rows, count = compile_rules(dsl_text)
+                self._last_compiled = (rows, count)
+                self._dirty = False
+            else:
+                # Mismo texto que el último parseo exitoso: solo se guarda
+                rows, count = self._last_compiled
+            # Se guarda también el hash del texto: si después se vuelve a
+            # aplicar el mismo documento, parse_rules_from_text no lo parsea
+            save_form_field_rules_bulk(
+                rows, source=(rules_text_hash(dsl_text), count)
+            )
         except TextXError as e:
             messagebox.showerror("DSL Error", f"Syntax/semantic error:\n{e}")
             return
@@ -167,27 +190,26 @@ class RulesIDE(tk.Tk):
         if self.viewer_tree is None:
             return
 
-        for item in self.viewer_tree.get_children():
-            self.viewer_tree.delete(item)
+        tree = self.viewer_tree
 
-        rules = list_form_rules()
+        # Un solo comando Tk para borrar todas las filas
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
 
-        for r in rules:
+        insert = tree.insert
+        for r in list_form_rules():
             requester_type, field_name, visible, required, label, options_json = r
-            visible_str = "yes" if visible else "no"
-            required_str = "yes" if required else "no"
-            options_str = options_json if options_json else ""
-
-            self.viewer_tree.insert(
+            insert(
                 "",
                 tk.END,
                 values=(
                     requester_type,
                     field_name,
-                    visible_str,
-                    required_str,
+                    "yes" if visible else "no",
+                    "yes" if required else "no",
                     label or "",
-                    options_str,
+                    options_json or "",
                 ),
             )
 
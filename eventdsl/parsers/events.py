@@ -10,15 +10,14 @@ Responsible for:
 """
 
 import os
-import sys
-from textx import metamodel_from_file
+from functools import lru_cache
 
-CODE_ROOT = os.path.dirname(os.path.dirname(__file__))
-if CODE_ROOT not in sys.path:
-    sys.path.append(CODE_ROOT)
-
-from db import init_db, save_event
-from validators.scheduling import (
+from ..db import (
+    init_db,
+    get_events_for_date_location_batch,
+    save_events_multirow,
+)
+from ..validators.scheduling import (
     validate_event_scheduling,
     SchedulingValidationError,
 )
@@ -31,8 +30,17 @@ GRAMMAR_PATH = os.path.join(
     "event_dsl.tx",
 )
 
-# Global metamodel for event_dsl
-event_mm = metamodel_from_file(GRAMMAR_PATH)
+
+@lru_cache(maxsize=1)
+def get_event_mm():
+    """
+    Build the textX metamodel for event_dsl once per process.
+    Call get_event_mm.cache_clear() to force a rebuild after editing the grammar.
+    Built on first use, so importing this module does not parse the grammar.
+    """
+    from textx import metamodel_from_file
+
+    return metamodel_from_file(GRAMMAR_PATH)
 
 
 def parse_and_save_events(dsl_file_path: str):
@@ -44,9 +52,17 @@ def parse_and_save_events(dsl_file_path: str):
     and no events are stored (all-or-nothing behavior).
     """
     init_db()
-    model = event_mm.model_from_file(dsl_file_path)
+    model = get_event_mm().model_from_file(dsl_file_path)
+
+    # Existing events for every (date, location) in the file, fetched
+    # up front in one batched query instead of one query per event
+    existing = get_events_for_date_location_batch(
+        (ev.date, ev.location) for ev in model.events
+    )
 
-    # First pass: validate all events
+    # Single pass: validate every event and collect its row. Nothing is
+    # stored until all of them are valid.
+    rows = []
     for ev in model.events:
         name = ev.name
         requester_type = ev.requester_type
@@ -63,6 +79,7 @@ def parse_and_save_events(dsl_file_path: str):
                 start_time=start_time,
                 end_time=end_time,
                 location=location,
+                existing_events=existing[(date, location)],
             )
         except SchedulingValidationError as e:
             raise SchedulingValidationError(
@@ -70,15 +87,9 @@ def parse_and_save_events(dsl_file_path: str):
                 f"({requester_type} @ {location}):\n{e}"
             )
 
-    # Second pass: if all are valid, store them
-    for ev in model.events:
-        save_event(
-            name=ev.name,
-            requester_type=ev.requester_type,
-            date=ev.date,
-            start_time=ev.start,
-            end_time=ev.end,
-            location=ev.location,
-        )
-
-    print(f"✅ Se guardaron {len(model.events)} evento(s) desde {dsl_file_path}")
+        rows.append((name, requester_type, date, start_time, end_time, location, None))
+
+    # All valid: store them in a single transaction using multi-row INSERTs
+    save_events_multirow(rows)
+
+    print(f"✅ Se guardaron {len(rows)} evento(s) desde {dsl_file_path}")
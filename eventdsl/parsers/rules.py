@@ -3,24 +3,23 @@
 Parser and validator for the EVENT RULES DSL (event_rules_dsl.tx).
 
 Responsibilities:
-- Load the textX metamodel for event_rules_dsl.tx.
+- Load the textX metamodel for event_rules_dsl.tx (lazily, on first parse).
 - Apply semantic validation rules on the parsed model.
 - Persist the resulting form configuration into the database.
 """
 
+import hashlib
 import os
 import sys
-from textx import metamodel_from_file, TextXError
+from functools import lru_cache
+from operator import attrgetter
+from itertools import islice
 
-CODE_ROOT = os.path.dirname(os.path.dirname(__file__))
-if CODE_ROOT not in sys.path:
-    sys.path.append(CODE_ROOT)
-
-from db import (
+from ..db import (
     init_db,
-    clear_form_rules,
-    save_form_field_rule,
-    list_form_rules,
+    get_form_rules_source,
+    save_form_field_rules_bulk,
+    iter_form_rules,
 )
 
 # Path to the rules grammar
@@ -31,8 +30,22 @@ GRAMMAR_RULES_PATH = os.path.join(
     "event_rules_dsl.tx",
 )
 
-# Global metamodel for event_rules_dsl
-event_rules_mm = metamodel_from_file(GRAMMAR_RULES_PATH)
+
+@lru_cache(maxsize=1)
+def get_event_rules_mm():
+    """
+    Build the textX metamodel for event_rules_dsl once per process.
+    Call get_event_rules_mm.cache_clear() to force a rebuild after editing the grammar.
+    Built on first use, so importing this module does not parse the grammar.
+    """
+    from textx import metamodel_from_file
+
+    return metamodel_from_file(GRAMMAR_RULES_PATH)
+
+
+# FieldConfig attributes read in a single C-level call per field
+_FIELD_VALUES = attrgetter("field_name", "visible", "required", "label", "options")
+
 
 # Fields that must exist in every event_form
 MANDATORY_FIELDS = {
@@ -56,9 +69,14 @@ ALLOWED_OPTION_FIELDS = {
 REQUIRED_REQUESTER_TYPES = {"Academics", "Students"}
 
 
-def validate_model(model):
+def validate_and_collect(model):
     """
-    Apply semantic validation rules to an already parsed model.
+    Apply semantic validation rules to an already parsed model and,
+    in the same pass, collect the rows to persist.
+
+    Returns:
+        list: (requester_type, field_name, visible, required, label, options)
+        tuples, ready for save_form_field_rules_bulk.
 
     Raises TextXError if any inconsistency is found:
     - initialize_runtime must be "yes".
@@ -68,6 +86,9 @@ def validate_model(model):
     - Mandatory fields must exist and be required.
     - Forms must exist for all required requester types.
     """
+    # Imported here so that importing this module does not load textX
+    from textx import TextXError
+
     # 1) Runtime must be enabled explicitly
     if model.init.status != "yes":
         raise TextXError(
@@ -76,9 +97,13 @@ def validate_model(model):
         )
 
     seen_requesters = set()
+    rows = []
+    append_row = rows.append
 
     for form in model.forms:
-        requester = form.requester_type
+        # requester_type and field_name come from a small fixed vocabulary:
+        # interned, every row (and every re-parse) shares the same strings
+        requester = sys.intern(form.requester_type)
 
         # 2) No more than one form per requester_type
         if requester in seen_requesters:
@@ -92,7 +117,9 @@ def validate_model(model):
         field_map = {}
 
         for field in form.fields:
-            name = field.field_name
+            name, visible, required, label, options = _FIELD_VALUES(field)
+            name = sys.intern(name)
+            required = required == "yes"
 
             # 3.1) No duplicate fields within the same form
             if name in field_map:
@@ -103,10 +130,7 @@ def validate_model(model):
             field_map[name] = field
 
             # 3.2) Only specific fields are allowed to have 'options'
-            has_options = hasattr(field, "options") and bool(
-                getattr(field, "options", [])
-            )
-            if has_options and name not in ALLOWED_OPTION_FIELDS:
+            if options and name not in ALLOWED_OPTION_FIELDS:
                 allowed_str = ", ".join(sorted(ALLOWED_OPTION_FIELDS))
                 raise TextXError(
                     f"Field '{name}' in event_form {requester} defines 'options', "
@@ -115,14 +139,18 @@ def validate_model(model):
 
             # 3.3) Mandatory fields must be required = yes
             if name in ALWAYS_REQUIRED_FIELDS:
-                if field.required != "yes":
+                if not required:
                     raise TextXError(
                         f"Field '{name}' in event_form {requester} must have "
                         f"'required = yes' because it is a mandatory field."
                     )
 
+            append_row(
+                (requester, name, visible == "yes", required, label, options or None)
+            )
+
         # 3.4) All mandatory fields must be present
-        missing = MANDATORY_FIELDS - set(field_map.keys())
+        missing = MANDATORY_FIELDS.difference(field_map)
         if missing:
             missing_str = ", ".join(sorted(missing))
             raise TextXError(
@@ -131,7 +159,7 @@ def validate_model(model):
             )
 
     # 4) There must be forms for all required requester types
-    missing_forms = REQUIRED_REQUESTER_TYPES - seen_requesters
+    missing_forms = REQUIRED_REQUESTER_TYPES.difference(seen_requesters)
     if missing_forms:
         miss_str = ", ".join(sorted(missing_forms))
         raise TextXError(
@@ -139,6 +167,34 @@ def validate_model(model):
             f"Define a form for each requester_type."
         )
 
+    return rows
+
+
+def compile_rules(dsl_text: str):
+    """
+    Parse and validate rules from a raw DSL string without touching
+    the database.
+
+    Returns:
+        tuple: (rows, form_count), where rows are ready for
+        save_form_field_rules_bulk and form_count is the number of
+        event_form blocks.
+    """
+    model = get_event_rules_mm().model_from_str(dsl_text)
+
+    # Semantic validation and row collection in a single pass over the model
+    rows = validate_and_collect(model)
+
+    return rows, len(model.forms)
+
+
+def rules_text_hash(dsl_text: str) -> bytes:
+    """
+    Hash of a rules document, stored with the rows it produced
+    (save_form_field_rules_bulk(..., source=(hash, form_count))).
+    """
+    return hashlib.blake2b(dsl_text.encode("utf-8"), digest_size=16).digest()
+
 
 def parse_rules_from_text(dsl_text: str) -> int:
     """
@@ -148,39 +204,28 @@ def parse_rules_from_text(dsl_text: str) -> int:
     Returns:
         int: Number of event_form blocks processed.
     """
-    init_db()
+    # Same text as the one the stored rules came from: nothing to re-parse
+    # or re-write (any other rule write clears the stored hash)
+    text_hash = rules_text_hash(dsl_text)
+    applied = get_form_rules_source()
+    if applied is not None and applied[0] == text_hash:
+        return applied[1]
 
-    model = event_rules_mm.model_from_str(dsl_text)
+    # Invalid input (e.g. initialize_runtime = no) is rejected here, before
+    # init_db; the check above does not create the database file either
+    rows, form_count = compile_rules(dsl_text)
 
-    # Semantic validation over the parsed model
-    validate_model(model)
+    init_db()
 
-    # If validation succeeds, existing rules are cleared and new ones are stored
-    clear_form_rules()
+    # If validation succeeds, existing rules are replaced by the new ones
+    # (clear + insert + source hash run in a single transaction)
+    save_form_field_rules_bulk(rows, source=(text_hash, form_count))
 
-    for form in model.forms:
-        requester_type = form.requester_type
+    return form_count
 
-        for field in form.fields:
-            name = field.field_name
-            visible = field.visible == "yes"
-            required = field.required == "yes"
-            label = getattr(field, "label", None)
-
-            options = None
-            if hasattr(field, "options") and field.options:
-                options = [opt for opt in field.options]
-
-            save_form_field_rule(
-                requester_type=requester_type,
-                field_name=name,
-                visible=visible,
-                required=required,
-                label=label,
-                options=options,
-            )
 
-    return len(model.forms)
+# Rules per stdout write in debug_print_rules
+DEBUG_PRINT_BLOCK = 1024
 
 
 def debug_print_rules():
@@ -188,13 +233,20 @@ def debug_print_rules():
     Helper to print all form rules currently stored in the database.
     Useful for manual inspection during development.
     """
-    rules = list_form_rules()
-    print("\nForm rules in DB:")
-    print("-" * 60)
-    for r in rules:
-        requester_type, field_name, visible, required, label, options_json = r
-        print(
-            f"{requester_type} | {field_name} | "
-            f"visible={bool(visible)} required={bool(required)} "
-            f"label={label!r} options={options_json}"
-        )
+    write = sys.stdout.write
+    write("\nForm rules in DB:\n" + "-" * 60 + "\n")
+
+    lines = (
+        f"{requester_type} | {field_name} | "
+        f"visible={bool(visible)} required={bool(required)} "
+        f"label={label!r} options={options_json}\n"
+        for requester_type, field_name, visible, required, label, options_json
+        in iter_form_rules()
+    )
+    # Rows are streamed from the cursor and written in blocks, one write
+    # per DEBUG_PRINT_BLOCK rules instead of a print per rule
+    while True:
+        block = "".join(islice(lines, DEBUG_PRINT_BLOCK))
+        if not block:
+            break
+        write(block)
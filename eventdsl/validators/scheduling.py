@@ -1,4 +1,6 @@
-from db import get_events_for_date_location
+from typing import List, Optional
+
+from ..db import get_conflicting_events
 
 
 class SchedulingValidationError(Exception):
@@ -11,12 +13,31 @@ def _parse_time_to_minutes(time_str: str) -> int:
     Convierte 'HH:MM' a minutos desde 00:00.
     Lanza SchedulingValidationError si el formato es incorrecto.
     """
+    # Camino rápido: exactamente 'HH:MM' en ASCII, con aritmética de bytes.
+    # Cualquier otra entrada (no str, no ASCII) va al camino general, que
+    # es el que convierte los errores en SchedulingValidationError.
+    if isinstance(time_str, str) and len(time_str) == 5 and time_str.isascii():
+        b = time_str.encode("ascii")
+    else:
+        b = b""
+    if len(b) == 5 and b[2] == 0x3A:  # ':'
+        d0, d1, d3, d4 = b[0] - 48, b[1] - 48, b[3] - 48, b[4] - 48
+        # Todos son dígitos si ningún d ni 9 - d es negativo
+        if (d0 | d1 | d3 | d4 | (9 - d0) | (9 - d1) | (9 - d3) | (9 - d4)) >= 0:
+            hour = d0 * 10 + d1
+            minute = d3 * 10 + d4
+            if hour < 24 and minute < 60:
+                return hour * 60 + minute
+
+    # Camino general ('H:MM', espacios alrededor) y mensajes de error
     try:
-        parts = time_str.strip().split(":")
-        if len(parts) != 2:
+        # Slicing alrededor del único ':' (sin la lista de split)
+        s = time_str.strip()
+        sep = s.find(":")
+        if sep < 0 or s.find(":", sep + 1) >= 0:
             raise ValueError
-        hour = int(parts[0])
-        minute = int(parts[1])
+        hour = int(s[:sep])
+        minute = int(s[sep + 1:])
         if not (0 <= hour < 24 and 0 <= minute < 60):
             raise ValueError
         return hour * 60 + minute
@@ -33,6 +54,7 @@ def validate_event_scheduling(
     start_time: str,
     end_time: str,
     location: str,
+    existing_events: Optional[List[tuple]] = None,
 ):
     """
     Reglas de negocio de agendado:
@@ -40,6 +62,11 @@ def validate_event_scheduling(
     - start_time < end_time
     - duración mínima 60 minutos
     - no traslape con otros eventos en misma fecha/location
+
+    existing_events: eventos ya agendados en esa fecha/location, si el
+    llamador ya los tiene (filas de get_events_for_date_location_batch:
+    con start_min/end_min al final y ordenadas por start_min). Si es None,
+    los conflictos se consultan en la BD.
     """
 
     # 1) Formato y orden de horas
@@ -60,10 +87,22 @@ def validate_event_scheduling(
         )
 
     # 3) Conflictos con otros eventos en misma fecha/location
-    existing_events = get_events_for_date_location(date, location)
+    if existing_events is None:
+        # El traslape se evalúa en SQL, solo regresan los conflictivos
+        conflicting_events = get_conflicting_events(date, location, start_min, end_min)
+    else:
+        # traslape si NO se cumple: new_end <= ev_start OR new_start >= ev_end.
+        # Como vienen ordenados por start_min, al primer evento que empieza
+        # en o después de end_min ya no puede haber más conflictos.
+        conflicting_events = []
+        for ev in existing_events:
+            if ev[8] >= end_min:
+                break
+            if ev[9] > start_min:
+                conflicting_events.append(ev[:8])
 
     conflicts = []
-    for ev in existing_events:
+    for ev in conflicting_events:
         (
             ev_id,
             ev_name,
@@ -75,17 +114,11 @@ def validate_event_scheduling(
             ev_requester_unit,
         ) = ev
 
-        ev_start_min = _parse_time_to_minutes(ev_start)
-        ev_end_min = _parse_time_to_minutes(ev_end)
-
-        # traslape si NO se cumple: new_end <= ev_start OR new_start >= ev_end
-        overlap = not (end_min <= ev_start_min or start_min >= ev_end_min)
-        if overlap:
-            extra = f", {ev_requester_unit}" if ev_requester_unit else ""
-            conflicts.append(
-                f"- [{ev_id}] {ev_date} {ev_start}-{ev_end} | {ev_name} "
-                f"({ev_requester}{extra} @ {ev_location})"
-            )
+        extra = f", {ev_requester_unit}" if ev_requester_unit else ""
+        conflicts.append(
+            f"- [{ev_id}] {ev_date} {ev_start}-{ev_end} | {ev_name} "
+            f"({ev_requester}{extra} @ {ev_location})"
+        )
 
     if conflicts:
         conflict_msg = "\n".join(conflicts)
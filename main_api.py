@@ -0,0 +1,45 @@
+"""
+Production entry point for the FastAPI backend (api_server.py).
+
+Worker math:
+- AST parsing (/rules-ast, /events-ast) is CPU-bound and serialized by
+  the GIL inside a worker, so parallelism comes from processes.
+- Use one worker per CPU core (the default here). Each worker runs at
+  most EVENTDSL_PARSE_CONCURRENCY parses at a time (default 2), so a
+  burst of slow parses cannot starve the DB endpoints of that worker.
+- Caches (AST, form-config) are per worker; the SQLite file is shared
+  and runs in WAL mode, so concurrent readers do not block each other.
+
+uvloop and httptools are used when installed, otherwise uvicorn falls
+back to asyncio and h11.
+
+Usage:
+    python main_api.py
+    EVENTDSL_WORKERS=4 EVENTDSL_PORT=8000 python main_api.py
+"""
+
+import importlib.util
+import os
+
+import uvicorn
+
+
+def _has_module(name: str) -> bool:
+    return importlib.util.find_spec(name) is not None
+
+
+def main():
+    workers = int(os.environ.get("EVENTDSL_WORKERS", os.cpu_count() or 1))
+
+    uvicorn.run(
+        "api_server:app",
+        host=os.environ.get("EVENTDSL_HOST", "127.0.0.1"),
+        port=int(os.environ.get("EVENTDSL_PORT", "8000")),
+        workers=workers,
+        loop="uvloop" if _has_module("uvloop") else "asyncio",
+        http="httptools" if _has_module("httptools") else "h11",
+    )
+
+
+if __name__ == "__main__":
+    main()
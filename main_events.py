@@ -1,29 +1,32 @@
 import sys
 import os
 
-from parsers.events import parse_and_save_events
-from db import list_events, init_db
+from eventdsl.parsers.events import parse_and_save_events
+from eventdsl.db import iter_events, init_db
 
 
 def print_all_events():
-    events = list_events()
-    if not events:
-        print("No hay eventos guardados todavía.")
-        return
-
-    print("\nEventos en la base de datos:")
-    print("-" * 60)
-    for ev in events:
-        ev_id, name, requester_type, date, start, end, location = ev
+    printed_header = False
+    for ev in iter_events():
+        if not printed_header:
+            print("\nEventos en la base de datos:")
+            print("-" * 60)
+            printed_header = True
+
+        ev_id, name, requester_type, date, start, end, location, requester_unit = ev
+        extra = f", {requester_unit}" if requester_unit else ""
         print(
             f"[{ev_id}] {date} {start}-{end} | {name} "
-            f"({requester_type}, @ {location}"
+            f"({requester_type}{extra} @ {location})"
         )
 
+    if not printed_header:
+        print("No hay eventos guardados todavía.")
+
 
 def main():
     if len(sys.argv) < 2:
-        print("Uso: python main_events.py examples/events/demo.evdsl")
+        print("Uso: python main_events.py examples/demo.evdsl")
         sys.exit(1)
 
     dsl_path = sys.argv[1]
@@ -0,0 +1,35 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from eventdsl import db
+
+
+def _drop_thread_conn():
+    # La conexión (y la caché de reglas) del hilo apuntan a la BD anterior
+    conn = getattr(db._tls, "conn", None)
+    if conn is not None:
+        with db._all_conns_lock:
+            db._all_conns.remove(conn)
+        conn.close()
+        del db._tls.conn
+    if hasattr(db._tls, "form_rules_cache"):
+        del db._tls.form_rules_cache
+
+
+class TempDBTestCase(unittest.TestCase):
+    """Each test runs against a fresh, initialized events.db in a temp dir."""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.db_path = os.path.join(tmp.name, "events.db")
+
+        _drop_thread_conn()
+        patcher = mock.patch.object(db, "DB_PATH", self.db_path)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(_drop_thread_conn)
+
+        db.init_db()
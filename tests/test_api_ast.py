@@ -0,0 +1,148 @@
+import unittest
+from unittest import mock
+
+from textx import TextXError
+
+import api_server
+from api_server import (
+    _EVENTS_BLOCK_RE,
+    _RULES_BLOCK_RE,
+    _events_block_ast,
+    _incremental_ast,
+    _rules_block_ast,
+    _split_blocks,
+    model_to_dict,
+)
+from eventdsl.parsers.events import get_event_mm
+from eventdsl.parsers.rules import get_event_rules_mm
+
+
+def _event(name, day, location="REC", description=None):
+    line = (
+        f'add event "{name}" for Students on 2025-12-{day:02d} '
+        f"from 09:00 to 11:00 at {location}"
+    )
+    if description is not None:
+        line += f' description "{description}"'
+    return line + "\n"
+
+
+def _form(requester_type, label="Event name"):
+    return (
+        f"event_form {requester_type} {{\n"
+        f'    event_name {{ visible = yes required = yes label = "{label}" }}\n'
+        f"    event_date {{ visible = yes required = yes }}\n"
+        f"    location {{ visible = yes required = yes options = [REC] }}\n"
+        f"}}\n"
+    )
+
+
+class IncrementalAstTest(unittest.TestCase):
+    def setUp(self):
+        _events_block_ast.cache_clear()
+        _rules_block_ast.cache_clear()
+
+    def events_ast(self, code):
+        return _incremental_ast(
+            code, get_event_mm(), _EVENTS_BLOCK_RE, _events_block_ast, "events"
+        )
+
+    def rules_ast(self, code):
+        return _incremental_ast(
+            code, get_event_rules_mm(), _RULES_BLOCK_RE, _rules_block_ast, "forms"
+        )
+
+    def assert_events_match_full_parse(self, code):
+        full = model_to_dict(get_event_mm().model_from_str(code))
+        self.assertEqual(self.events_ast(code), full)
+
+    def assert_rules_match_full_parse(self, code):
+        full = model_to_dict(get_event_rules_mm().model_from_str(code))
+        self.assertEqual(self.rules_ast(code), full)
+
+    def test_split_round_trips(self):
+        code = "\n" + _event("A", 1) + _event("B", 2) + _event("C", 3)
+        chunks = _split_blocks(code, _EVENTS_BLOCK_RE)
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual("".join(chunks), code)
+
+    def test_split_ignores_keywords_inside_identifiers(self):
+        code = "add x address y_add add_z readd\nadd w"
+        self.assertEqual(
+            _split_blocks(code, _EVENTS_BLOCK_RE),
+            ["add x address y_add add_z readd\n", "add w"],
+        )
+        code = "event_form A my_event_form event_forms\nevent_form B"
+        self.assertEqual(len(_split_blocks(code, _RULES_BLOCK_RE)), 2)
+
+    def test_edited_middle_event_block(self):
+        before = _event("A", 1) + _event("B", 2) + _event("C", 3)
+        after = _event("A", 1) + _event("B edited", 4, "SB116") + _event("C", 3)
+
+        self.assert_events_match_full_parse(before)
+        self.assert_events_match_full_parse(after)
+        # Only the edited block was parsed again
+        info = _events_block_ast.cache_info()
+        self.assertEqual((info.hits, info.misses), (2, 4))
+
+    def test_edited_middle_rules_block(self):
+        before = "initialize_runtime = yes\n" + _form("Academics") + _form("Students")
+        after = (
+            "initialize_runtime = yes\n"
+            + _form("Academics")
+            + _form("Students", label="Changed")
+            + _form("Academics", label="Third")
+        )
+        self.assert_rules_match_full_parse(before)
+        self.assert_rules_match_full_parse(after)
+
+    def test_keywords_inside_strings(self):
+        code = (
+            _event("add event for Students", 1, description="add event_form")
+            + _event("Paddle add-on", 2, description="address the add")
+            + _event("additional", 3)
+        )
+        self.assertEqual(len(_split_blocks(code, _EVENTS_BLOCK_RE)), 3)
+        self.assert_events_match_full_parse(code)
+
+        rules = (
+            "initialize_runtime = yes\n"
+            + _form("Academics", label="event_form Students {")
+            + _form("Students", label="my_event_form")
+        )
+        self.assertEqual(len(_split_blocks(rules, _RULES_BLOCK_RE)), 2)
+        self.assert_rules_match_full_parse(rules)
+
+    def test_block_failing_alone_falls_back_to_full_parse(self):
+        # With these grammars every block of a valid document parses on
+        # its own, so the failing block is simulated
+        code = _event("A", 1) + _event("B", 2) + _event("C", 3)
+
+        def block_ast(chunk):
+            if '"B"' in chunk:
+                raise TextXError("block does not parse alone")
+            return _events_block_ast(chunk)
+
+        ast_dict = _incremental_ast(
+            code, get_event_mm(), _EVENTS_BLOCK_RE, block_ast, "events"
+        )
+        self.assertEqual(ast_dict, model_to_dict(get_event_mm().model_from_str(code)))
+
+    def test_invalid_block_reports_position_in_whole_document(self):
+        code = _event("A", 1) + _event("B", 2) + "add event oops\n"
+        with self.assertRaises(TextXError) as ctx:
+            self.events_ast(code)
+        self.assertEqual(ctx.exception.line, 3)
+
+    def test_events_endpoint_body_uses_incremental_ast(self):
+        api_server._events_ast.cache_clear()
+        code = _event("A", 1) + _event("B", 2)
+        with mock.patch.object(
+            api_server, "_events_block_ast", wraps=_events_block_ast
+        ) as block_ast:
+            api_server._events_ast(code)
+        self.assertEqual(block_ast.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+import unittest
+
+from eventdsl.db import (
+    DATE_LOCATION_BATCH,
+    get_events_for_date_location,
+    get_events_for_date_location_batch,
+    save_event,
+    save_events_multirow,
+)
+
+from dbtest import TempDBTestCase
+
+
+def _minutes(hhmm):
+    hours, minutes = hhmm.split(":")
+    return int(hours) * 60 + int(minutes)
+
+
+class EventsForDateLocationBatchTest(TempDBTestCase):
+    def add(self, date, location, start, end):
+        save_event("event", "Students", date, start, end, location)
+
+    def assert_matches_per_pair(self, pairs):
+        result = get_events_for_date_location_batch(pairs)
+        self.assertEqual(set(result), set(pairs))
+
+        for pair in pairs:
+            rows = result[pair]
+            expected = get_events_for_date_location(*pair)
+            # Same events as the per-pair query, plus start_min/end_min...
+            self.assertEqual(
+                sorted(row[:8] for row in rows), sorted(tuple(r) for r in expected)
+            )
+            for row in rows:
+                self.assertEqual(row[8], _minutes(row[4]))
+                self.assertEqual(row[9], _minutes(row[5]))
+            # ...ordered by start_min, not by the start_time text
+            self.assertEqual([row[8] for row in rows], sorted(row[8] for row in rows))
+        return result
+
+    def test_several_pairs(self):
+        self.add("2025-12-01", "REC", "13:00", "14:00")
+        self.add("2025-12-01", "REC", "9:00", "10:00")
+        self.add("2025-12-01", "REC", "10:30", "12:00")
+        self.add("2025-12-01", "SB116", "08:00", "09:00")
+        self.add("2025-12-02", "REC", "08:00", "09:00")
+
+        result = self.assert_matches_per_pair(
+            [("2025-12-01", "REC"), ("2025-12-01", "SB116"), ("2025-12-02", "REC")]
+        )
+        self.assertEqual(
+            [row[4] for row in result[("2025-12-01", "REC")]],
+            ["9:00", "10:30", "13:00"],
+        )
+
+    def test_pairs_without_events(self):
+        self.add("2025-12-01", "REC", "09:00", "10:00")
+
+        result = self.assert_matches_per_pair(
+            [("2025-12-01", "REC"), ("2025-12-01", "PoolArea"), ("2030-01-01", "REC")]
+        )
+        self.assertEqual(result[("2025-12-01", "PoolArea")], [])
+        self.assertEqual(result[("2030-01-01", "REC")], [])
+
+    def test_no_pairs(self):
+        self.assertEqual(get_events_for_date_location_batch([]), {})
+
+    def test_duplicate_pairs(self):
+        self.add("2025-12-01", "REC", "09:00", "10:00")
+        result = get_events_for_date_location_batch(
+            [("2025-12-01", "REC"), ("2025-12-01", "REC")]
+        )
+        self.assertEqual(len(result[("2025-12-01", "REC")]), 1)
+
+    def test_more_pairs_than_one_batch(self):
+        locations = ["REC", "SB116", "PoolArea"]
+        pairs = [
+            (f"2025-{month:02d}-{day:02d}", location)
+            for month in range(1, 13)
+            for day in range(1, 29)
+            for location in locations
+        ][: DATE_LOCATION_BATCH + 50]
+        self.assertGreater(len(pairs), DATE_LOCATION_BATCH)
+
+        # Events for every other pair, on both sides of the batch boundary
+        save_events_multirow(
+            ("event", "Students", date, start, end, location, None)
+            for index, (date, location) in enumerate(pairs)
+            if index % 2 == 0
+            for start, end in (("14:00", "15:00"), ("9:00", "10:00"))
+        )
+        self.assert_matches_per_pair(pairs)
+
+
+if __name__ == "__main__":
+    unittest.main()
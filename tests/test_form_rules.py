@@ -0,0 +1,156 @@
+import unittest
+
+from eventdsl import db
+from eventdsl.db import (
+    _form_rules_delta,
+    get_conn,
+    list_form_rules,
+    save_form_field_rules_bulk,
+)
+
+from dbtest import TempDBTestCase
+
+
+A = ("Academics", "event_name", 1, 1, "Name", None)
+B = ("Academics", "location", 1, 1, "", '["REC"]')
+C = ("Students", "event_name", 1, 1, "", None)
+D = ("Students", "description", 0, 0, "", None)
+
+
+def _current(*rows):
+    # Filas como las devuelve _SQL_FORM_RULES_BY_ID: (id, ...valores)
+    return [(index, *row) for index, row in enumerate(rows, start=1)]
+
+
+class FormRulesDeltaTest(unittest.TestCase):
+    def test_pure_delete(self):
+        self.assertEqual(_form_rules_delta(_current(A, B, C), [A, C]), ([2], []))
+
+    def test_pure_append(self):
+        self.assertEqual(_form_rules_delta(_current(A, B), [A, B, C]), ([], [C]))
+
+    def test_delete_and_append(self):
+        self.assertEqual(
+            _form_rules_delta(_current(A, B, C), [A, C, D]), ([2], [D])
+        )
+
+    def test_reorder_needs_full_rewrite(self):
+        self.assertIsNone(_form_rules_delta(_current(A, B, C), [B, A, C]))
+
+    def test_duplicate_new_rows_need_full_rewrite(self):
+        self.assertIsNone(_form_rules_delta(_current(A, B), [A, B, B]))
+
+    def test_duplicate_stored_rows_need_full_rewrite(self):
+        self.assertIsNone(_form_rules_delta(_current(A, A, B), [A, B]))
+
+
+def _rule(requester_type, field_name, options=None):
+    return (requester_type, field_name, True, True, "", options)
+
+
+ACADEMICS_NAME = _rule("Academics", "event_name")
+ACADEMICS_LOCATION = _rule("Academics", "location", ["REC", "SB116"])
+STUDENTS_NAME = _rule("Students", "event_name")
+STUDENTS_LOCATION = _rule("Students", "location", ["REC"])
+
+
+class SaveFormFieldRulesBulkTest(TempDBTestCase):
+    def stored(self):
+        return get_conn().execute(db._SQL_FORM_RULES_BY_ID).fetchall()
+
+    def stored_ids(self):
+        return [row[0] for row in self.stored()]
+
+    def assert_listed(self, rows):
+        # list_form_rules memoriza: después de cada escritura debe
+        # reflejar las filas nuevas, no las de la lectura anterior
+        expected = sorted(
+            (r, f, int(v), int(q), label, db._dump_options(options))
+            for r, f, v, q, label, options in rows
+        )
+        self.assertEqual(list_form_rules(), expected)
+
+    def assert_requester_index(self):
+        row = get_conn().execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND name = 'idx_form_fields_requester'"
+        ).fetchone()
+        self.assertIsNotNone(row)
+
+    def save(self, rows):
+        save_form_field_rules_bulk(rows)
+        self.assert_listed(rows)
+
+    def test_first_load(self):
+        self.assert_listed([])
+        self.save([ACADEMICS_NAME, ACADEMICS_LOCATION, STUDENTS_NAME])
+        self.assert_requester_index()
+
+    def test_pure_delete_keeps_remaining_rows(self):
+        self.save([ACADEMICS_NAME, ACADEMICS_LOCATION, STUDENTS_NAME])
+        ids = self.stored_ids()
+
+        self.save([ACADEMICS_NAME, STUDENTS_NAME])
+        self.assertEqual(self.stored_ids(), [ids[0], ids[2]])
+
+    def test_pure_append_keeps_existing_rows(self):
+        self.save([ACADEMICS_NAME, ACADEMICS_LOCATION])
+        ids = self.stored_ids()
+
+        self.save([ACADEMICS_NAME, ACADEMICS_LOCATION, STUDENTS_NAME])
+        self.assertEqual(self.stored_ids()[:2], ids)
+        self.assertEqual(len(self.stored_ids()), 3)
+
+    def test_delete_and_append(self):
+        self.save([ACADEMICS_NAME, ACADEMICS_LOCATION, STUDENTS_NAME])
+        ids = self.stored_ids()
+
+        self.save([ACADEMICS_NAME, STUDENTS_NAME, STUDENTS_LOCATION])
+        new_ids = self.stored_ids()
+        self.assertEqual(new_ids[:2], [ids[0], ids[2]])
+        self.assertGreater(new_ids[2], ids[2])
+
+    def test_option_change_is_delete_and_append(self):
+        self.save([ACADEMICS_NAME, STUDENTS_LOCATION])
+        self.save([ACADEMICS_NAME, _rule("Students", "location", ["SB116"])])
+        self.assertEqual(
+            db.get_form_rules_for_requester("Students"),
+            [("location", 1, 1, "", ["SB116"])],
+        )
+
+    def test_reorder_rewrites_table_and_index(self):
+        self.save([ACADEMICS_NAME, ACADEMICS_LOCATION, STUDENTS_NAME])
+        ids = self.stored_ids()
+
+        self.save([ACADEMICS_LOCATION, ACADEMICS_NAME, STUDENTS_NAME])
+        self.assertTrue(set(self.stored_ids()).isdisjoint(ids))
+        self.assert_requester_index()
+        self.assertEqual(
+            [row[0] for row in db.get_form_rules_for_requester("Academics")],
+            ["location", "event_name"],
+        )
+
+    def test_duplicate_new_rows_rewrite_table(self):
+        self.save([ACADEMICS_NAME])
+        self.save([ACADEMICS_NAME, STUDENTS_NAME, STUDENTS_NAME])
+        self.assertEqual(len(self.stored_ids()), 3)
+        self.assert_requester_index()
+
+    def test_duplicate_stored_rows_rewrite_table(self):
+        self.save([ACADEMICS_NAME, ACADEMICS_NAME, STUDENTS_NAME])
+        ids = self.stored_ids()
+
+        self.save([ACADEMICS_NAME, STUDENTS_NAME])
+        self.assertTrue(set(self.stored_ids()).isdisjoint(ids))
+        self.assert_requester_index()
+
+    def test_source_is_stored_and_cleared(self):
+        save_form_field_rules_bulk([ACADEMICS_NAME], source=(b"hash", 1))
+        self.assertEqual(db.get_form_rules_source(), (b"hash", 1))
+
+        save_form_field_rules_bulk([ACADEMICS_NAME, STUDENTS_NAME])
+        self.assertIsNone(db.get_form_rules_source())
+
+
+if __name__ == "__main__":
+    unittest.main()
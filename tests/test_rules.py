@@ -0,0 +1,83 @@
+import unittest
+from unittest import mock
+
+from eventdsl import db
+from eventdsl.parsers import rules
+from eventdsl.parsers.rules import parse_rules_from_text, rules_text_hash
+
+from dbtest import TempDBTestCase
+
+
+RULES = """
+initialize_runtime = yes
+event_form Academics {
+    event_name { visible = yes required = yes label = "Event name" }
+    event_date { visible = yes required = yes }
+    start_time { visible = yes required = yes }
+    end_time { visible = yes required = yes }
+    location { visible = yes required = yes options = [PellasRoom, REC] }
+    description { visible = no required = no }
+}
+event_form Students {
+    event_name { visible = yes required = yes }
+    event_date { visible = yes required = yes }
+    start_time { visible = yes required = yes }
+    end_time { visible = yes required = yes }
+    location { visible = yes required = yes options = [REC] }
+}
+"""
+
+
+class ParseRulesFromTextTest(TempDBTestCase):
+    def setUp(self):
+        super().setUp()
+        patcher = mock.patch.object(
+            rules, "compile_rules", wraps=rules.compile_rules
+        )
+        self.compile_rules = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_text_twice_skips_the_parse(self):
+        self.assertEqual(parse_rules_from_text(RULES), 2)
+        stored = db.list_form_rules()
+
+        self.assertEqual(parse_rules_from_text(RULES), 2)
+        self.assertEqual(self.compile_rules.call_count, 1)
+        self.assertEqual(db.list_form_rules(), stored)
+        self.assertEqual(db.get_form_rules_source(), (rules_text_hash(RULES), 2))
+
+    def test_changed_text_is_parsed_again(self):
+        parse_rules_from_text(RULES)
+        parse_rules_from_text(RULES.replace("[PellasRoom, REC]", "[REC]"))
+        self.assertEqual(self.compile_rules.call_count, 2)
+        self.assertEqual(
+            db.get_form_rules_for_requester("Academics")[4],
+            ("location", 1, 1, "", ["REC"]),
+        )
+
+    def test_other_rule_writes_clear_the_source(self):
+        writes = {
+            "save_form_field_rule": lambda: db.save_form_field_rule(
+                "Students", "description", False, False, None, None
+            ),
+            "save_form_field_rules_bulk": lambda: db.save_form_field_rules_bulk(
+                [("Students", "event_name", True, True, "", None)]
+            ),
+            "clear_form_rules": db.clear_form_rules,
+        }
+        for name, write in writes.items():
+            with self.subTest(write=name):
+                parse_rules_from_text(RULES)
+                self.assertIsNotNone(db.get_form_rules_source())
+                self.compile_rules.reset_mock()
+
+                write()
+                self.assertIsNone(db.get_form_rules_source())
+
+                # The stored rules no longer match the text: parsed again
+                parse_rules_from_text(RULES)
+                self.assertEqual(self.compile_rules.call_count, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
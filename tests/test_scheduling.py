@@ -0,0 +1,37 @@
+import unittest
+
+from eventdsl.validators.scheduling import (
+    SchedulingValidationError,
+    _parse_time_to_minutes,
+)
+
+
+class ParseTimeToMinutesTest(unittest.TestCase):
+    def test_valid_times(self):
+        self.assertEqual(_parse_time_to_minutes("00:00"), 0)
+        self.assertEqual(_parse_time_to_minutes("13:45"), 13 * 60 + 45)
+        self.assertEqual(_parse_time_to_minutes("23:59"), 23 * 60 + 59)
+        self.assertEqual(_parse_time_to_minutes("9:00"), 9 * 60)
+        self.assertEqual(_parse_time_to_minutes(" 09:30 "), 9 * 60 + 30)
+
+    def test_invalid_input_raises_validation_error(self):
+        for value in (
+            "",
+            "24:00",
+            "12:60",
+            "ab:cd",
+            "12-30",
+            "12:30:00",
+            "\ud800",
+            "1\ud800:00",
+            "é1:00",
+            None,
+            1230,
+        ):
+            with self.subTest(value=value):
+                with self.assertRaises(SchedulingValidationError):
+                    _parse_time_to_minutes(value)
+
+
+if __name__ == "__main__":
+    unittest.main()